@@ -417,7 +417,7 @@ async def check_and_log(
     name_filter : Sequence[str], optional
         A filter for names.
     parallel : bool, optional
-        Pre-fill cache in parallel when possible.
+        Pre-fill cache and run comparisons in parallel when possible.
     cache : DataCache
         The data cache instance.
     """
@@ -437,7 +437,7 @@ async def check_and_log(
             return
 
     try:
-        await prepared_file.compare()
+        await prepared_file.compare(parallel=parallel)
     except asyncio.CancelledError:
         console.print("Tests interrupted; showing partial results.")
         for task in cache_fill_tasks or []:
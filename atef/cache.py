@@ -6,8 +6,8 @@ import dataclasses
 import logging
 import typing
 from dataclasses import dataclass, field
-from typing import (Any, Dict, Hashable, Iterable, Mapping, Optional, Type,
-                    TypeVar, cast)
+from typing import (Any, Awaitable, Dict, Hashable, Iterable, Mapping,
+                    Optional, Tuple, Type, TypeVar, cast)
 
 import ophyd
 
@@ -15,7 +15,7 @@ from .reduce import ReduceMethod, get_data_for_signal_async
 from .type_hints import Number
 
 if typing.TYPE_CHECKING:
-    from . import tools
+    from . import check, tools
 
 _CacheSignalType = TypeVar("_CacheSignalType", bound=ophyd.Signal)
 
@@ -114,6 +114,15 @@ def _freeze(data):
 
 @dataclass
 class DataCache:
+    """
+    Cache of signal and tool data, shared by the comparisons of a run.
+
+    Entries are never refreshed: once acquired, data is reused for the
+    lifetime of the cache (or until ``clear`` is called).  Create one
+    cache per run of a configuration file and pass it down during
+    preparation, rather than sharing a single cache between runs, so
+    that every run reads fresh values.
+    """
     signal_data: Dict[ophyd.Signal, Dict[DataKey, Any]] = field(default_factory=dict)
     signals: _SignalCache[ophyd.EpicsSignal] = field(
         default_factory=get_signal_cache
@@ -121,12 +130,110 @@ class DataCache:
     tool_data: Dict[ToolKey, Any] = field(
         default_factory=dict
     )
+    #: Tool cache keys, by tool id, along with the tool they were made for.
+    tool_keys: Dict[int, Tuple[tools.Tool, ToolKey]] = field(
+        default_factory=dict, repr=False
+    )
+    #: In-flight comparison preparation, keyed by the comparison's id.
+    comparison_prepare: Dict[int, asyncio.Future] = field(
+        default_factory=dict, repr=False
+    )
 
     def clear(self) -> None:
         """Clear the data cache."""
         for data in list(self.signal_data.values()):
             data.clear()
         self.tool_data.clear()
+        self.tool_keys.clear()
+
+    async def prefetch(
+        self,
+        signal_requests: Iterable[Tuple[ophyd.Signal, DataKey]] = (),
+        tools: Iterable[tools.Tool] = (),
+        max_concurrency: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        """
+        Acquire data for many signals and tools in one batch.
+
+        Every missing cache entry is registered before any data is awaited,
+        so that concurrent callers of ``get_signal_data`` or ``get_tool_data``
+        wait on the in-flight request instead of issuing their own.  Errors are
+        not raised here; they are stored in the cache and raised to the
+        caller that retrieves the data.
+
+        Parameters
+        ----------
+        signal_requests : iterable of (ophyd.Signal, DataKey)
+            Signals and the acquisition settings to use for each.
+        tools : iterable of tools.Tool
+            Tools to run.
+        max_concurrency : int, optional
+            The maximum number of signal acquisitions in flight at once.
+            Unlimited if unset.
+        executor : concurrent.futures.Executor, optional
+            The executor to run the synchronous calls in.  Defaults to
+            the loop-defined default executor.
+        """
+        semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        )
+
+        async def bounded(coro: Awaitable[Any]) -> Any:
+            if semaphore is None:
+                return await coro
+            async with semaphore:
+                return await coro
+
+        pending = []
+        for signal, key in signal_requests:
+            signal_data = self.signal_data.setdefault(signal, {})
+            data = signal_data.get(key, None)
+            if data is None and key not in signal_data:
+                data = asyncio.create_task(
+                    bounded(
+                        self._update_signal_data_by_key(
+                            signal, key, executor=executor
+                        )
+                    )
+                )
+                signal_data[key] = data
+            if isinstance(data, asyncio.Future):
+                pending.append(data)
+
+        pending.extend(self.get_tool_data(tool) for tool in tools)
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def prepare_comparison(self, comparison: check.Comparison) -> None:
+        """
+        Prepare a comparison's dynamic values using this cache.
+
+        A comparison shared by many identifiers is wrapped by many prepared
+        comparisons, which may all run at once.  Concurrent calls for the
+        same comparison instance wait on a single ``prepare`` call rather
+        than each repeating the work.  Calls made after it completes will
+        prepare the comparison again.
+
+        Parameters
+        ----------
+        comparison : check.Comparison
+            The comparison to prepare.
+        """
+        key = id(comparison)
+        task = self.comparison_prepare.get(key, None)
+        if task is None:
+            # The task holds a reference to the comparison, so its id cannot
+            # be reused while the entry exists
+            task = asyncio.ensure_future(comparison.prepare(self))
+            self.comparison_prepare[key] = task
+
+            def remove_entry(fut: asyncio.Future) -> None:
+                if self.comparison_prepare.get(key, None) is fut:
+                    del self.comparison_prepare[key]
+
+            task.add_done_callback(remove_entry)
+
+        await asyncio.shield(task)
 
     async def get_pv_data(
         self,
@@ -209,6 +316,35 @@ class DataCache:
             The acquired data.
         """
         key = DataKey(period=reduce_period, method=reduce_method, string=string)
+        return await self.get_signal_data_by_key(signal, key, executor=executor)
+
+    async def get_signal_data_by_key(
+        self,
+        signal: ophyd.Signal,
+        key: DataKey,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Optional[Any]:
+        """
+        Get signal data with data reduction settings given by ``key``.
+
+        As in :meth:`get_signal_data`, for callers that hold onto a
+        ``DataKey`` rather than building one per call.
+
+        Parameters
+        ----------
+        signal : ophyd.Signal
+            The signal to retrieve data from.
+        key : DataKey
+            The data reduction settings.
+        executor : concurrent.futures.Executor, optional
+            The executor to run the synchronous call in.  Defaults to
+            the loop-defined default executor.
+
+        Returns
+        -------
+        Any
+            The acquired data.
+        """
         signal_data = self.signal_data.setdefault(signal, {})
         try:
             data = signal_data[key]
@@ -219,7 +355,9 @@ class DataCache:
             signal_data[key] = data
 
         if isinstance(data, asyncio.Future):
-            return await data
+            # Shared by all requests for this key: cancelling one request
+            # must not cancel the others
+            return await asyncio.shield(data)
         return data
 
     async def _update_signal_data_by_key(
@@ -284,7 +422,7 @@ class DataCache:
             The acquired data.
         """
         try:
-            key = ToolKey.from_tool(tool)
+            key = self._get_tool_key(tool)
         except Exception:
             # Unhashable for some reason: we need to fix `_freeze`. Re-run
             # the tool on demand and don't cache its results.
@@ -303,10 +441,33 @@ class DataCache:
             self.tool_data[key] = data
 
         if isinstance(data, asyncio.Future):
-            return await data
+            # Shared by all requests for this key: cancelling one request
+            # must not cancel the others
+            return await asyncio.shield(data)
 
         return data
 
+    def _get_tool_key(self, tool: tools.Tool) -> ToolKey:
+        """
+        Get the cache key for ``tool``.
+
+        Building a key copies and freezes the tool's settings, so it is done
+        once per tool instance.  Every comparison of a tool configuration
+        shares the same tool.
+        """
+        try:
+            cached_tool, key = self.tool_keys[id(tool)]
+        except KeyError:
+            pass
+        else:
+            if cached_tool is tool:
+                return key
+
+        key = ToolKey.from_tool(tool)
+        # Hold on to the tool so that its id is not reused
+        self.tool_keys[id(tool)] = (tool, key)
+        return key
+
     async def _update_tool_by_key(
         self,
         tool: tools.Tool,
@@ -7,12 +7,16 @@ which link ``Comparisons`` to specific identifiers and hold ``Result`` objects.
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
 import json
 import logging
+import mmap
 import pathlib
+import sys
 from dataclasses import dataclass, field
-from typing import (Any, Dict, Generator, List, Literal, Optional, Sequence,
-                    Tuple, Union, cast, get_args)
+from typing import (Any, Awaitable, Callable, Dict, Generator, List, Literal,
+                    Optional, Sequence, Tuple, Union, cast, get_args)
 
 import apischema
 import happi
@@ -24,17 +28,45 @@ from atef.find_replace import RegexFindReplace
 from atef.result import _summarize_result_severity
 
 from . import serialization, tools, util
-from .cache import DataCache
+from .cache import DataCache, DataKey
 from .check import Comparison
 from .enums import GroupResultMode, Severity
 from .exceptions import PreparationError, PreparedComparisonException
 from .result import Result, incomplete_result
 from .type_hints import AnyPath
-from .yaml_support import init_yaml_support
+from .yaml_support import _YAML_DUMPER, _YAML_LOADER, init_yaml_support
+
+try:
+    import orjson
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+    #: orjson parses any buffer, including a memory-mapped file, without a copy
+    _json_loads_buffer = True
+except ImportError:
+    try:
+        import ujson
+        _json_loads = ujson.loads
+    except ImportError:
+        _json_loads = json.loads
+    _json_loads_buffer = False
 
 logger = logging.getLogger(__name__)
 
 
+def _load_json_contents(contents: Union[mmap.mmap, bytes]) -> Any:
+    """Parse JSON file contents with the fastest available parser."""
+    try:
+        if _json_loads_buffer:
+            with memoryview(contents) as view:
+                return _json_loads(view)
+        return _json_loads(contents[:])
+    except ValueError:
+        # The accelerated parsers are stricter than the standard
+        # library (e.g., NaN/Infinity literals); retry with json
+        if _json_loads is json.loads:
+            raise
+        return json.loads(contents[:])
+
+
 @dataclass
 @serialization.as_tagged_union
 class Configuration:
@@ -139,14 +171,17 @@ class ConfigurationGroup(Configuration):
     mode: GroupResultMode = GroupResultMode.all_
 
     def walk_configs(self) -> Generator[AnyConfiguration, None, None]:
-        for config in self.configs:
+        # Depth-first, pre-order traversal with an explicit stack (children
+        # are pushed in reverse to preserve ordering)
+        stack = list(reversed(self.configs))
+        while stack:
             # `config` is stored as Configuration due to the tagged union;
             # however we never yield Configuration instances, just subclasses
             # thereof:
-            config = cast(AnyConfiguration, config)
+            config = cast(AnyConfiguration, stack.pop())
             yield config
             if isinstance(config, ConfigurationGroup):
-                yield from config.walk_configs()
+                stack.extend(reversed(config.configs))
 
     def children(self) -> List[Configuration]:
         """Return children of this group, as a tree view might expect"""
@@ -344,6 +379,9 @@ class ConfigurationFile:
     #: Top-level configuration group.
     root: ConfigurationGroup = field(default_factory=ConfigurationGroup)
 
+    def __post_init__(self):
+        self.clear_indices()
+
     def walk_configs(self) -> Generator[AnyConfiguration, None, None]:
         """
         Walk configurations defined in this file.  This includes the "root"
@@ -360,31 +398,77 @@ class ConfigurationFile:
         """Return children of this group, as a tree view might expect"""
         return [self.root]
 
+    def clear_indices(self) -> None:
+        """
+        Clear the lookup indices used by ``get_by_device``, ``get_by_pv``, and
+        ``get_by_tag``.
+
+        The indices are rebuilt on next use.  This must be called after
+        modifying configurations in this file (other than replacing ``root``,
+        which is detected automatically).
+        """
+        self._indexed_root: Optional[ConfigurationGroup] = None
+        self._configs: Optional[List[AnyConfiguration]] = None
+        self._by_device: Optional[Dict[str, List[DeviceConfiguration]]] = None
+        self._by_pv: Optional[Dict[str, List[PVConfiguration]]] = None
+        self._by_tag: Optional[Dict[str, List[int]]] = None
+
+    def _build_indices(self) -> None:
+        """Build the device, PV, and tag indices if missing or outdated."""
+        if self._configs is not None and self._indexed_root is self.root:
+            return
+
+        configs = list(self.walk_configs())
+        by_device: Dict[str, List[DeviceConfiguration]] = {}
+        by_pv: Dict[str, List[PVConfiguration]] = {}
+        by_tag: Dict[str, List[int]] = {}
+        for idx, config in enumerate(configs):
+            if isinstance(config, DeviceConfiguration):
+                for name in dict.fromkeys(config.devices):
+                    by_device.setdefault(name, []).append(config)
+            elif isinstance(config, PVConfiguration):
+                for pvname in config.by_pv:
+                    by_pv.setdefault(pvname, []).append(config)
+            for tag in dict.fromkeys(config.tags or ()):
+                by_tag.setdefault(tag, []).append(idx)
+
+        self._indexed_root = self.root
+        self._configs = configs
+        self._by_device = by_device
+        self._by_pv = by_pv
+        self._by_tag = by_tag
+
     def get_by_device(self, name: str) -> Generator[DeviceConfiguration, None, None]:
         """Get all configurations that match the device name."""
-        for config in self.walk_configs():
-            if isinstance(config, DeviceConfiguration):
-                if name in config.devices:
-                    yield config
+        self._build_indices()
+        yield from self._by_device.get(name, [])
 
     def get_by_pv(
         self, pvname: str
     ) -> Generator[PVConfiguration, None, None]:
         """Get all configurations + IdentifierAndComparison that match the PV name."""
-        for config in self.walk_configs():
-            if isinstance(config, PVConfiguration):
-                if pvname in config.by_pv:
-                    yield config
+        self._build_indices()
+        yield from self._by_pv.get(pvname, [])
 
     def get_by_tag(self, *tags: str) -> Generator[Configuration, None, None]:
         """Get all configurations that match the tag name."""
         if not tags:
             return
 
-        tag_set = set(tags)
-        for config in self.walk_configs():
-            if tag_set.intersection(set(config.tags or [])):
-                yield config
+        self._build_indices()
+        if len(tags) == 1:
+            # Index entries are already unique and in walk order
+            for idx in self._by_tag.get(tags[0], []):
+                yield self._configs[idx]
+            return
+
+        # Indices are positions in walk order, so sorting them preserves
+        # the order of configurations in the file
+        indices = set()
+        for tag in tags:
+            indices.update(self._by_tag.get(tag, []))
+        for idx in sorted(indices):
+            yield self._configs[idx]
 
     @classmethod
     def from_filename(cls, filename: AnyPath) -> ConfigurationFile:
@@ -397,27 +481,48 @@ class ConfigurationFile:
         return config
 
     @classmethod
-    def from_json(cls, filename: AnyPath) -> ConfigurationFile:
-        """Load a configuration file from JSON."""
-        with open(filename) as fp:
-            serialized_config = json.load(fp)
-        return apischema.deserialize(cls, serialized_config)
+    def from_json(
+        cls,
+        filename: AnyPath,
+        loader: Optional[Callable[[bytes], Any]] = None,
+    ) -> ConfigurationFile:
+        """
+        Load a configuration file from JSON.
+
+        Parameters
+        ----------
+        filename : AnyPath
+            The JSON file to load.
+        loader : Callable[[bytes], Any], optional
+            The function used to parse the raw file contents.  Defaults to
+            the fastest available of orjson, ujson, and the standard library
+            json module.
+        """
+        with util.mapped_file(filename) as contents:
+            if loader is not None:
+                serialized_config = loader(contents[:])
+            else:
+                serialized_config = _load_json_contents(contents)
+        return serialization.get_deserialization_method(cls)(serialized_config)
 
     @classmethod
     def from_yaml(cls, filename: AnyPath) -> ConfigurationFile:
         """Load a configuration file from yaml."""
-        with open(filename) as fp:
-            serialized_config = yaml.safe_load(fp)
-        return apischema.deserialize(cls, serialized_config)
+        with util.mapped_file(filename) as contents:
+            serialized_config = yaml.load(contents, Loader=_YAML_LOADER)
+        return serialization.get_deserialization_method(cls)(serialized_config)
 
     def to_json(self):
         """Dump this configuration file to a JSON-compatible dictionary."""
-        return apischema.serialize(ConfigurationFile, self, exclude_defaults=True)
+        serialize = serialization.get_serialization_method(
+            ConfigurationFile, exclude_defaults=True
+        )
+        return serialize(self)
 
     def to_yaml(self):
         """Dump this configuration file to yaml."""
         init_yaml_support()
-        return yaml.dump(self.to_json())
+        return yaml.dump(self.to_json(), Dumper=_YAML_DUMPER)
 
     def validate(self) -> Tuple[bool, str]:
         """
@@ -441,7 +546,7 @@ class ConfigurationFile:
         return True, ''
 
 
-@dataclass
+@util.slotted_dataclass
 class PreparedFile:
     #: The data cache to use for the preparation step.
     cache: DataCache = field(repr=False)
@@ -451,6 +556,18 @@ class PreparedFile:
     client: happi.Client
     #: The comparisons defined in the top-level file.
     root: PreparedGroup
+    #: The root group that the flattened walks were built from.
+    _walked_root: Optional[PreparedGroup] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    #: All prepared configurations, in walk order.
+    _groups: Optional[List[AnyPreparedConfiguration]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    #: All prepared comparisons, in walk order.
+    _comparisons: Optional[List[PreparedComparison]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_config(
@@ -501,54 +618,112 @@ class PreparedFile:
         prepared_root.parent = prepared_file
         return prepared_file
 
-    async def fill_cache(self, parallel: bool = True) -> Optional[List[asyncio.Task]]:
+    async def fill_cache(
+        self,
+        parallel: bool = True,
+        max_concurrency: int = 64,
+    ) -> Optional[List[asyncio.Task]]:
         """
         Fill the DataCache.
 
+        The data requested by every prepared comparison is gathered up front
+        and submitted to the cache as a single batch.  Comparisons which
+        request identical data are only queried once.
+
         Parameters
         ----------
         parallel : bool, optional
             By default, fill the cache in parallel with multiple asyncio tasks.
             If False, fill the cache sequentially.
+        max_concurrency : int, optional
+            The maximum number of data requests in flight at once when
+            filling the cache in parallel.
 
         Returns
         -------
         List[asyncio.Task] or None
             The tasks created when in parallel mode.
         """
+        signal_requests: Dict[Tuple[ophyd.Signal, DataKey], None] = {}
+        tools_by_id: Dict[int, tools.Tool] = {}
+        for prepared in self.walk_comparisons():
+            if isinstance(prepared, PreparedSignalComparison):
+                if prepared.signal is not None:
+                    signal_requests[(prepared.signal, prepared.data_key)] = None
+            elif isinstance(prepared, PreparedToolComparison):
+                tools_by_id[id(prepared.tool)] = prepared.tool
+
+        prefetch = self.cache.prefetch(
+            signal_requests=list(signal_requests),
+            tools=list(tools_by_id.values()),
+            max_concurrency=max_concurrency if parallel else 1,
+        )
         if not parallel:
-            for prepared in self.walk_comparisons():
-                await prepared.get_data_async()
+            await prefetch
             return None
 
-        tasks = []
-        for prepared in self.walk_comparisons():
-            task = asyncio.create_task(prepared.get_data_async())
-            tasks.append(task)
+        return [asyncio.create_task(prefetch)]
 
-        return tasks
+    def clear_walk_cache(self) -> None:
+        """
+        Clear the flattened lists used by ``walk_groups`` and
+        ``walk_comparisons``.
+
+        The lists are rebuilt on next use.  This must be called after
+        modifying prepared configurations in this file (other than replacing
+        ``root``, which is detected automatically).
+        """
+        self._walked_root = None
+        self._groups = None
+        self._comparisons = None
+
+    def _build_walk_cache(self) -> None:
+        """Flatten the prepared tree if not yet done or outdated."""
+        if self._groups is not None and self._walked_root is self.root:
+            return
+
+        self._groups = [self.root, *self.root.walk_groups()]
+        self._comparisons = list(self.root.walk_comparisons())
+        self._walked_root = self.root
 
     def walk_comparisons(self) -> Generator[PreparedComparison, None, None]:
         """Walk through the prepared comparisons."""
-        yield from self.root.walk_comparisons()
+        self._build_walk_cache()
+        yield from self._comparisons
 
     def walk_groups(
         self,
     ) -> Generator[AnyPreparedConfiguration, None, None]:
         """Walk through the prepared groups."""
-        yield self.root
-        yield from self.root.walk_groups()
+        self._build_walk_cache()
+        yield from self._groups
 
     def children(self) -> List[PreparedGroup]:
         """Return children of this group, as a tree view might expect"""
         return [self.root]
 
-    async def compare(self) -> Result:
-        """Run all comparisons and return a combined result."""
-        return await self.root.compare()
+    async def compare(
+        self,
+        parallel: bool = False,
+        max_concurrency: int = 64,
+    ) -> Result:
+        """
+        Run all comparisons and return a combined result.
 
+        Parameters
+        ----------
+        parallel : bool, optional
+            Run configurations and comparisons concurrently.  By default,
+            they are run one at a time.
+        max_concurrency : int, optional
+            The maximum number of comparisons in flight at once across the
+            whole file when running in parallel.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency) if parallel else None
+        return await self.root.compare(semaphore=semaphore)
 
-@dataclass
+
+@util.slotted_dataclass
 class FailedConfiguration:
     """
     A Configuration that failed to be prepared for running.
@@ -563,7 +738,7 @@ class FailedConfiguration:
     exception: Optional[Exception] = None
 
 
-@dataclass
+@util.slotted_dataclass
 class PreparedConfiguration:
     """
     Base class for a Configuration that has been prepared to run.
@@ -621,40 +796,9 @@ class PreparedConfiguration:
             cache = DataCache()
 
         try:
-            if isinstance(config, PVConfiguration):
-                return PreparedPVConfiguration.from_config(
-                    config=config,
-                    cache=cache,
-                    parent=parent,
-                )
-            if isinstance(config, ToolConfiguration):
-                return PreparedToolConfiguration.from_config(
-                    cache=cache,
-                    config=config,
-                    parent=parent,
-                )
-            if isinstance(config, DeviceConfiguration):
-                return PreparedDeviceConfiguration.from_config(
-                    cache=cache,
-                    config=config,
-                    client=client,
-                    parent=parent,
-                )
-            if isinstance(config, ConfigurationGroup):
-                return PreparedGroup.from_config(
-                    config,
-                    cache=cache,
-                    client=client,
-                    parent=parent,
-                )
-            if isinstance(config, TemplateConfiguration):
-                return PreparedTemplateConfiguration.from_config(
-                    config,
-                    cache=cache,
-                    client=client,
-                    parent=parent,
-                )
-            raise NotImplementedError(f"Configuration type unsupported: {type(config)}")
+            return _prepare_config(
+                config, parent=parent, client=client, cache=cache
+            )
         except PreparedComparisonException as ex:
             return FailedConfiguration(
                 config=config,
@@ -686,12 +830,26 @@ class PreparedConfiguration:
         """Walk through the prepared comparisons."""
         yield from self.comparisons
 
-    async def compare(self) -> Result:
-        """Run all comparisons and return a combined result."""
-        results = []
-        for config in self.comparisons:
-            if isinstance(config, PreparedComparison):
-                results.append(await config.compare())
+    async def compare(
+        self,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Result:
+        """
+        Run all comparisons and return a combined result.
+
+        Parameters
+        ----------
+        semaphore : asyncio.Semaphore, optional
+            If provided, run the comparisons concurrently, limited by this
+            semaphore.  Otherwise, run them one at a time.
+        """
+        results = await run_prepared_comparisons(
+            [
+                config for config in self.comparisons
+                if isinstance(config, PreparedComparison)
+            ],
+            semaphore=semaphore,
+        )
 
         if self.prepare_failures:
             result = Result(
@@ -725,7 +883,7 @@ class PreparedConfiguration:
         return result
 
 
-@dataclass
+@util.slotted_dataclass
 class PreparedGroup(PreparedConfiguration):
     #: The corresponding group from the configuration file.
     config: ConfigurationGroup = field(default_factory=ConfigurationGroup)
@@ -842,23 +1000,60 @@ class PreparedGroup(PreparedConfiguration):
         self,
     ) -> Generator[AnyPreparedConfiguration, None, None]:
         """Walk through the prepared groups."""
-        for config in self.configs:
-            if isinstance(config, get_args(AnyPreparedConfiguration)):
+        prepared_types = get_args(AnyPreparedConfiguration)
+        stack = list(reversed(self.configs))
+        while stack:
+            config = stack.pop()
+            if isinstance(config, prepared_types):
                 yield config
                 if isinstance(config, PreparedGroup):
-                    yield from config.walk_groups()
+                    stack.extend(reversed(config.configs))
 
     def walk_comparisons(self) -> Generator[PreparedComparison, None, None]:
         """Walk through the prepared comparisons."""
-        for config in self.configs:
-            yield from config.walk_comparisons()
+        stack = list(reversed(self.configs))
+        while stack:
+            config = stack.pop()
+            if isinstance(config, PreparedGroup):
+                stack.extend(reversed(config.configs))
+            else:
+                yield from config.walk_comparisons()
 
-    async def compare(self) -> Result:
-        """Run all comparisons and return a combined result."""
-        results = []
-        for config in self.configs:
-            if isinstance(config, PreparedConfiguration):
-                results.append(await config.compare())
+    async def compare(
+        self,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Result:
+        """
+        Run all comparisons and return a combined result.
+
+        In ``any`` mode, the first successful configuration determines the
+        result and the remaining configurations are not run, or cancelled if
+        already running.
+
+        Parameters
+        ----------
+        semaphore : asyncio.Semaphore, optional
+            If provided, run the configurations in the group concurrently, with
+            this semaphore shared by all of their comparisons.  Otherwise, run
+            them one at a time.
+        """
+        configs = [
+            config for config in self.configs
+            if isinstance(config, PreparedConfiguration)
+        ]
+
+        def compare_config(config: PreparedConfiguration) -> Awaitable[Result]:
+            return config.compare(semaphore=semaphore)
+
+        stop_on_success = self.config.mode == GroupResultMode.any_
+        if semaphore is None:
+            results = await _compare_in_order(
+                configs, compare_config, stop_on_success=stop_on_success
+            )
+        elif stop_on_success:
+            results = await _compare_until_success(configs, compare_config)
+        else:
+            results = await _compare_all(configs, compare_config)
 
         if self.prepare_failures:
             result = Result(
@@ -896,7 +1091,7 @@ class PreparedGroup(PreparedConfiguration):
         return result
 
 
-@dataclass
+@util.slotted_dataclass
 class PreparedDeviceConfiguration(PreparedConfiguration):
     #: The configuration settings.
     config: DeviceConfiguration = field(default_factory=DeviceConfiguration)
@@ -1002,9 +1197,16 @@ class PreparedDeviceConfiguration(PreparedConfiguration):
             cache = DataCache()
 
         devices = list(additional_devices or [])
+        resolved = util.get_happi_devices_by_names(config.devices, client=client)
         for dev_name in config.devices:
             try:
-                devices.append(util.get_happi_device_by_name(dev_name, client=client))
+                if dev_name in resolved:
+                    device = resolved[dev_name]
+                    if isinstance(device, Exception):
+                        raise device
+                else:
+                    device = util.get_happi_device_by_name(dev_name, client=client)
+                devices.append(device)
             except Exception as ex:
                 raise PreparedComparisonException(
                     message=f"Failed to load happi device: {dev_name}",
@@ -1016,7 +1218,7 @@ class PreparedDeviceConfiguration(PreparedConfiguration):
 
         prepared_comparisons = []
         prepare_failures = []
-        shared = config.shared or []
+        shared = tuple(config.shared or ())
 
         prepared = PreparedDeviceConfiguration(
             config=config,
@@ -1027,26 +1229,26 @@ class PreparedDeviceConfiguration(PreparedConfiguration):
             prepare_failures=prepare_failures,
         )
 
+        by_attr = {
+            attr: tuple(itertools.chain(comparisons, shared))
+            for attr, comparisons in config.by_attr.items()
+        }
         for device in devices:
-            for attr, comparisons in config.by_attr.items():
-                for comparison in comparisons + shared:
-                    try:
-                        prepared_comparisons.append(
-                            PreparedSignalComparison.from_device(
-                                device=device,
-                                attr=attr,
-                                comparison=comparison,
-                                parent=prepared,
-                                cache=cache,
-                            )
-                        )
-                    except Exception as ex:
-                        prepare_failures.append(ex)
+            device_comparisons, device_failures = (
+                PreparedSignalComparison.from_device_batch(
+                    device=device,
+                    by_attr=by_attr,
+                    parent=prepared,
+                    cache=cache,
+                )
+            )
+            prepared_comparisons.extend(device_comparisons)
+            prepare_failures.extend(device_failures)
 
         return prepared
 
 
-@dataclass
+@util.slotted_dataclass
 class PreparedPVConfiguration(PreparedConfiguration):
     #: The configuration settings.
     config: PVConfiguration = field(default_factory=PVConfiguration)
@@ -1125,7 +1327,7 @@ class PreparedPVConfiguration(PreparedConfiguration):
 
         prepared_comparisons = []
         prepare_failures = []
-        shared = config.shared or []
+        shared = tuple(config.shared or ())
 
         prepared = PreparedPVConfiguration(
             config=config,
@@ -1136,7 +1338,7 @@ class PreparedPVConfiguration(PreparedConfiguration):
         )
 
         for pvname, comparisons in config.by_pv.items():
-            for comparison in comparisons + shared:
+            for comparison in itertools.chain(comparisons, shared):
                 try:
                     prepared_comparisons.append(
                         PreparedSignalComparison.from_pvname(
@@ -1152,7 +1354,7 @@ class PreparedPVConfiguration(PreparedConfiguration):
         return prepared
 
 
-@dataclass
+@util.slotted_dataclass
 class PreparedToolConfiguration(PreparedConfiguration):
     #: The configuration settings.
     config: ToolConfiguration = field(default_factory=ToolConfiguration)
@@ -1235,7 +1437,7 @@ class PreparedToolConfiguration(PreparedConfiguration):
 
         prepared_comparisons = []
         prepare_failures = []
-        shared = config.shared or []
+        shared = tuple(config.shared or ())
 
         prepared = PreparedToolConfiguration(
             config=config,
@@ -1246,7 +1448,7 @@ class PreparedToolConfiguration(PreparedConfiguration):
         )
 
         for result_key, comparisons in config.by_attr.items():
-            for comparison in comparisons + shared:
+            for comparison in itertools.chain(comparisons, shared):
                 try:
                     prepared_comparisons.append(
                         PreparedToolComparison.from_tool(
@@ -1263,7 +1465,7 @@ class PreparedToolConfiguration(PreparedConfiguration):
         return prepared
 
 
-@dataclass
+@util.slotted_dataclass
 class PreparedTemplateConfiguration(PreparedConfiguration):
     # configuration origin
     config: TemplateConfiguration = field(default_factory=TemplateConfiguration)
@@ -1351,9 +1553,20 @@ class PreparedTemplateConfiguration(PreparedConfiguration):
         )
         return prepared
 
-    async def compare(self) -> Result:
-        """Run the edited checkout and return the combined result"""
-        result = await self.file.compare()
+    async def compare(
+        self,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Result:
+        """
+        Run the edited checkout and return the combined result
+
+        Parameters
+        ----------
+        semaphore : asyncio.Semaphore, optional
+            If provided, run the checkout's configurations concurrently,
+            limited by this semaphore.  Otherwise, run them one at a time.
+        """
+        result = await self.file.root.compare(semaphore=semaphore)
         self.combined_result = result
         return result
 
@@ -1367,7 +1580,7 @@ class PreparedTemplateConfiguration(PreparedConfiguration):
         return self.combined_result
 
 
-@dataclass
+@util.slotted_dataclass
 class PreparedComparison:
     """
     A unified representation of comparisons for device signals and standalone PVs.
@@ -1384,6 +1597,9 @@ class PreparedComparison:
     parent: Optional[PreparedGroup] = field(default=None, repr=False)
     #: The last result of the comparison, if run.
     result: Result = field(default_factory=incomplete_result)
+    #: The data the comparison was last run on.  Excluded from equality and
+    #: repr, as it may be a large array.
+    data: Optional[Any] = field(default=None, compare=False, repr=False)
 
     async def get_data_async(self) -> Any:
         """
@@ -1417,7 +1633,7 @@ class PreparedComparison:
         """
         try:
             if hasattr(self.comparison, 'prepare'):
-                await self.comparison.prepare(self.cache)
+                await self.cache.prepare_comparison(self.comparison)
         except (TimeoutError, asyncio.TimeoutError, ConnectionTimeoutError):
             result = Result(
                 severity=self.comparison.if_disconnected,
@@ -1474,7 +1690,7 @@ class PreparedComparison:
         return result
 
 
-@dataclass
+@util.slotted_dataclass
 class PreparedSignalComparison(PreparedComparison):
     """
     A unified representation of comparisons for device signals and standalone
@@ -1498,8 +1714,22 @@ class PreparedSignalComparison(PreparedComparison):
     device: Optional[ophyd.Device] = None
     #: The signal the comparison is to be run on.
     signal: Optional[ophyd.Signal] = None
-    #: The value from the signal the comparison is to be run on.
-    data: Optional[Any] = None
+    #: The data reduction settings of the comparison, captured when prepared.
+    _data_key: DataKey = field(
+        default_factory=DataKey, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._data_key = DataKey(
+            period=self.comparison.reduce_period,
+            method=self.comparison.reduce_method,
+            string=self.comparison.string or False,
+        )
+
+    @property
+    def data_key(self) -> DataKey:
+        """The cache key describing how data is acquired for the comparison."""
+        return self._data_key
 
     async def get_data_async(self) -> Any:
         """
@@ -1520,25 +1750,26 @@ class PreparedSignalComparison(PreparedComparison):
         if signal is None:
             raise ValueError("Signal instance unset")
 
-        data = await self.cache.get_signal_data(
-            signal,
-            reduce_period=self.comparison.reduce_period,
-            reduce_method=self.comparison.reduce_method,
-            string=self.comparison.string or False,
-        )
-
+        data = await self.cache.get_signal_data_by_key(signal, self._data_key)
         self.data = data
         return data
 
     async def _compare(self, data: Any) -> Result:
         """
-        Run the comparison with the already-acquired data in ``self.data``.
+        Run the comparison with the already-acquired ``data``.
         """
         if data is None:
             # 'None' is likely incompatible with our comparisons and should
             # be raised for separately
+            severity = self.comparison.if_disconnected
+            if severity == Severity.success:
+                # Skip describing the comparison for a result that passes
+                return Result(
+                    severity,
+                    f"No data available for signal {self.identifier!r}",
+                )
             return Result(
-                severity=self.comparison.if_disconnected,
+                severity=severity,
                 reason=(
                     f"No data available for signal {self.identifier!r} in "
                     f"comparison {self.comparison}"
@@ -1583,18 +1814,13 @@ class PreparedSignalComparison(PreparedComparison):
         -------
         PreparedSignalComparison
         """
-        full_attr = f"{device.name}.{attr}"
-        logger.debug("Checking %s with comparison %s", full_attr, comparison)
+        full_attr = _get_full_attr(device, attr)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Checking %s with comparison %s", full_attr, comparison)
         if cache is None:
             cache = DataCache()
 
-        signal = getattr(device, attr, None)
-        if signal is None:
-            raise AttributeError(
-                f"Attribute {full_attr} does not exist on class "
-                f"{type(device).__name__}"
-            )
-
+        signal = _get_device_signal(device, attr, full_attr)
         return cls(
             name=name,
             device=device,
@@ -1605,6 +1831,72 @@ class PreparedSignalComparison(PreparedComparison):
             cache=cache,
         )
 
+    @classmethod
+    def from_device_batch(
+        cls,
+        device: ophyd.Device,
+        by_attr: Dict[str, Sequence[Comparison]],
+        parent: Optional[PreparedDeviceConfiguration] = None,
+        cache: Optional[DataCache] = None,
+    ) -> Tuple[List[PreparedSignalComparison], List[Exception]]:
+        """
+        Create PreparedComparisons for a number of a device's attributes.
+
+        Equivalent to calling ``from_device`` for every attribute and
+        comparison, but each attribute is only looked up once regardless of
+        how many comparisons use it.
+
+        Parameters
+        ----------
+        device : ophyd.Device
+            The ophyd Device.
+        by_attr : Dict[str, Sequence[Comparison]]
+            Attribute name (which may be in dotted notation) to the
+            comparisons to run on it.
+        parent : PreparedDeviceConfiguration, optional
+            The parent configuration, if available.
+        cache : DataCache, optional
+            The data cache instance, if available.  If unspecified, a new data
+            cache will be instantiated.
+
+        Returns
+        -------
+        List[PreparedSignalComparison]
+            The prepared comparisons.
+        List[Exception]
+            One exception per comparison that could not be prepared.
+        """
+        if cache is None:
+            cache = DataCache()
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        prepared = []
+        failures = []
+        for attr, comparisons in by_attr.items():
+            full_attr = _get_full_attr(device, attr)
+            try:
+                signal = _get_device_signal(device, attr, full_attr)
+            except Exception as ex:
+                failures.extend(ex for _ in comparisons)
+                continue
+
+            for comparison in comparisons:
+                if debug:
+                    logger.debug(
+                        "Checking %s with comparison %s", full_attr, comparison
+                    )
+                prepared.append(
+                    cls(
+                        device=device,
+                        identifier=full_attr,
+                        comparison=comparison,
+                        signal=signal,
+                        parent=parent,
+                        cache=cache,
+                    )
+                )
+        return prepared, failures
+
     @classmethod
     def from_pvname(
         cls,
@@ -1692,7 +1984,7 @@ class PreparedSignalComparison(PreparedComparison):
         )
 
 
-@dataclass
+@util.slotted_dataclass
 class PreparedToolComparison(PreparedComparison):
     """
     A unified representation of comparisons for device signals and standalone PVs.
@@ -1709,6 +2001,14 @@ class PreparedToolComparison(PreparedComparison):
     """
     #: The device the comparison applies to, if applicable.
     tool: tools.Tool = field(default_factory=lambda: tools.Ping(hosts=[]))
+    #: Retrieves the value for ``identifier`` from the tool result, with the
+    #: key parsed once at preparation time.
+    _extract: Optional[Callable[[Any], Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._extract = tools.get_result_value_extractor(self.identifier)
 
     async def get_data_async(self) -> Any:
         """
@@ -1731,10 +2031,17 @@ class PreparedToolComparison(PreparedComparison):
             The result of the comparison.  This is also set in ``self.result``.
         """
         try:
-            value = tools.get_result_value_by_key(data, self.identifier)
+            value = self._extract(data)
         except KeyError as ex:
+            severity = self.comparison.severity_on_failure
+            if severity == Severity.success:
+                # Skip describing the tool and comparison for a passing result
+                return Result(
+                    severity,
+                    f"Provided key is invalid for tool result: {ex}",
+                )
             return Result(
-                severity=self.comparison.severity_on_failure,
+                severity=severity,
                 reason=(
                     f"Provided key is invalid for tool result {self.tool} "
                     f"{self.identifier!r} ({self.name}): {ex} "
@@ -1799,14 +2106,237 @@ AnyPreparedConfiguration = Union[
     PreparedTemplateConfiguration,
 ]
 
-_class_to_prepared: Dict[type, type] = {
-    ConfigurationFile: PreparedFile,
-    ConfigurationGroup: PreparedGroup,
-    ToolConfiguration: PreparedToolConfiguration,
-    DeviceConfiguration: PreparedDeviceConfiguration,
-    PVConfiguration: PreparedPVConfiguration,
-    TemplateConfiguration: PreparedTemplateConfiguration,
-}
+
+@functools.singledispatch
+def _prepare_config(
+    config: Any,
+    *,
+    parent: Optional[PreparedGroup] = None,
+    client: Optional[happi.Client] = None,
+    cache: DataCache,
+) -> AnyPreparedConfiguration:
+    """
+    Prepare a configuration, dispatching on its type.
+
+    Subclasses of a registered configuration class use the closest
+    registered base class.
+    """
+    raise NotImplementedError(f"Configuration type unsupported: {type(config)}")
+
+
+@_prepare_config.register
+def _(config: PVConfiguration, *, parent=None, client=None, cache):
+    return PreparedPVConfiguration.from_config(config, parent=parent, cache=cache)
+
+
+@_prepare_config.register
+def _(config: ToolConfiguration, *, parent=None, client=None, cache):
+    return PreparedToolConfiguration.from_config(
+        config, parent=parent, cache=cache
+    )
+
+
+@_prepare_config.register
+def _(config: DeviceConfiguration, *, parent=None, client=None, cache):
+    return PreparedDeviceConfiguration.from_config(
+        config, parent=parent, client=client, cache=cache
+    )
+
+
+@_prepare_config.register
+def _(config: ConfigurationGroup, *, parent=None, client=None, cache):
+    return PreparedGroup.from_config(
+        config, parent=parent, client=client, cache=cache
+    )
+
+
+@_prepare_config.register
+def _(config: TemplateConfiguration, *, parent=None, client=None, cache):
+    return PreparedTemplateConfiguration.from_config(
+        config, parent=parent, client=client, cache=cache
+    )
+
+
+def _result_from_compare_error(item: Any, ex: BaseException) -> Result:
+    """Create a Result for an item whose ``compare()`` raised."""
+    # Use a short label: the full repr of a prepared item includes its
+    # parent, and so the whole surrounding tree
+    config = getattr(item, "config", None)
+    label = (
+        getattr(config, "name", None)
+        or getattr(item, "name", None)
+        or getattr(item, "identifier", None)
+        or type(item).__name__
+    )
+    return Result(
+        severity=Severity.internal_error,
+        reason=f"Failed to run {label!r}: {ex.__class__.__name__}: {ex}",
+    )
+
+
+async def _compare_in_order(
+    items: Sequence[Union[PreparedComparison, PreparedConfiguration]],
+    compare: Callable[[Any], Awaitable[Result]],
+    stop_on_success: bool = False,
+) -> List[Result]:
+    """
+    Run ``compare(item)`` on each item in turn and return the results.
+
+    If ``stop_on_success`` is set, items after the first success are not run:
+    their results are reset to incomplete and are not included.
+    """
+    results = []
+    for idx, item in enumerate(items):
+        try:
+            result = await compare(item)
+        except Exception as ex:
+            result = _result_from_compare_error(item, ex)
+        results.append(result)
+        if stop_on_success and result.severity == Severity.success:
+            for skipped in items[idx + 1:]:
+                _reset_results(skipped)
+            break
+    return results
+
+
+async def _compare_all(
+    items: Sequence[Union[PreparedComparison, PreparedConfiguration]],
+    compare: Callable[[Any], Awaitable[Result]],
+) -> List[Result]:
+    """
+    Run ``compare(item)`` on all items concurrently and return the results.
+
+    Exceptions are converted into internal error results for their item.
+    """
+    results = await asyncio.gather(
+        *(compare(item) for item in items),
+        return_exceptions=True,
+    )
+    return [
+        _result_from_compare_error(item, result)
+        if isinstance(result, BaseException) else result
+        for item, result in zip(items, results)
+    ]
+
+
+async def _compare_until_success(
+    items: Sequence[Union[PreparedComparison, PreparedConfiguration]],
+    compare: Callable[[Any], Awaitable[Result]],
+) -> List[Result]:
+    """
+    Run ``compare(item)`` on all items concurrently until one succeeds.
+
+    Items still running after the first success are cancelled: their results
+    are reset to incomplete and are not included.
+    """
+    tasks = {asyncio.ensure_future(compare(item)): item for item in items}
+    pending = set(tasks)
+    results = []
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                try:
+                    results.append(task.result())
+                except (Exception, asyncio.CancelledError) as ex:
+                    results.append(_result_from_compare_error(tasks[task], ex))
+            if any(result.severity == Severity.success for result in results):
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        for task in pending:
+            _reset_results(tasks[task])
+    return results
+
+
+def _reset_results(
+    item: Union[PreparedComparison, PreparedConfiguration],
+) -> None:
+    """
+    Reset the results of ``item`` and everything beneath it to incomplete.
+
+    Used for items that were not run, so that results from an earlier run
+    are not reported as current.
+    """
+    stack = [item]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, PreparedComparison):
+            item.result = incomplete_result()
+        elif isinstance(item, PreparedConfiguration):
+            item.combined_result = incomplete_result()
+            if isinstance(item, PreparedGroup):
+                stack.extend(item.configs)
+            elif isinstance(item, PreparedTemplateConfiguration):
+                stack.append(item.file.root)
+            else:
+                stack.extend(item.comparisons)
+
+
+async def run_prepared_comparisons(
+    items: Sequence[PreparedComparison],
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> List[Result]:
+    """
+    Run prepared comparisons and return their results.
+
+    A comparison that raises gets an internal error result instead.
+
+    Parameters
+    ----------
+    items : Sequence[PreparedComparison]
+        The comparisons to run.
+    semaphore : asyncio.Semaphore, optional
+        If provided, run the comparisons concurrently, with each one holding
+        the semaphore while it runs.  Sharing a semaphore between calls
+        limits the comparisons in flight across all of them.  Otherwise,
+        run the comparisons one at a time.
+
+    Returns
+    -------
+    List[Result]
+        The results, in the same order as ``items``.
+    """
+    if semaphore is None:
+        return await _compare_in_order(items, lambda item: item.compare())
+
+    async def bounded_compare(item: PreparedComparison) -> Result:
+        async with semaphore:
+            return await item.compare()
+
+    return await _compare_all(items, bounded_compare)
+
+
+def _get_full_attr(device: ophyd.Device, attr: str) -> str:
+    """
+    Get the identifier for ``attr`` of ``device``.
+
+    Identifiers are interned, so equal identifiers from separate
+    preparations of a file are the same object and short-circuit to an
+    identity check in dictionary and set lookups.
+    """
+    return sys.intern(f"{device.name}.{attr}")
+
+
+def _get_device_signal(
+    device: ophyd.Device, attr: str, full_attr: str
+) -> ophyd.Signal:
+    """Get the signal at ``attr`` of ``device``, raising if it is missing."""
+    signal = getattr(device, attr, None)
+    if signal is None:
+        raise AttributeError(
+            f"Attribute {full_attr} does not exist on class "
+            f"{type(device).__name__}"
+        )
+    return signal
+
+
+_NO_RESULT_REASON = "no result available (comparison not run?)"
 
 
 def get_result_from_comparison(
@@ -1830,21 +2360,16 @@ def get_result_from_comparison(
         The result instance.
     """
     if item is None:
-        return None, Result(
-            severity=Severity.internal_error,
-            reason="no result available (comparison not run?)"
-        )
+        return None, Result(Severity.internal_error, _NO_RESULT_REASON)
+
     if isinstance(item, Exception):
         # An error that was transformed into a Result with a severity
         return None, Result.from_exception(item)
 
-    if item.result is None:
-        return item, Result(
-            severity=Severity.internal_error,
-            reason="no result available (comparison not run?)"
-        )
-
-    return item, item.result
+    result = item.result
+    if result is None:
+        return item, Result(Severity.internal_error, _NO_RESULT_REASON)
+    return item, result
 
 
 async def run_passive_step(
@@ -45,7 +45,7 @@ from atef.plan_utils import (BlueskyState, GlobalRunEngine,
 from atef.reduce import ReduceMethod
 from atef.result import Result, _summarize_result_severity, incomplete_result
 from atef.type_hints import AnyDataclass, AnyPath, Number, PrimitiveType
-from atef.yaml_support import init_yaml_support
+from atef.yaml_support import _YAML_DUMPER, _YAML_LOADER, init_yaml_support
 
 from . import serialization
 
@@ -402,23 +402,26 @@ class ProcedureFile:
         """Load a configuration file from JSON."""
         with open(filename) as fp:
             serialized_config = json.load(fp)
-        return apischema.deserialize(cls, serialized_config)
+        return serialization.get_deserialization_method(cls)(serialized_config)
 
     @classmethod
     def from_yaml(cls, filename: AnyPath) -> ProcedureFile:
         """Load a configuration file from yaml."""
-        with open(filename) as fp:
-            serialized_config = yaml.safe_load(fp)
-        return apischema.deserialize(cls, serialized_config)
+        with util.mapped_file(filename) as contents:
+            serialized_config = yaml.load(contents, Loader=_YAML_LOADER)
+        return serialization.get_deserialization_method(cls)(serialized_config)
 
     def to_json(self):
         """Dump this configuration file to a JSON-compatible dictionary."""
-        return apischema.serialize(ProcedureFile, self, exclude_defaults=True)
+        serialize = serialization.get_serialization_method(
+            ProcedureFile, exclude_defaults=True
+        )
+        return serialize(self)
 
     def to_yaml(self):
         """Dump this configuration file to yaml."""
         init_yaml_support()
-        return yaml.dump(self.to_json())
+        return yaml.dump(self.to_json(), Dumper=_YAML_DUMPER)
 
     def validate(self) -> Tuple[bool, str]:
         """Validate the file is properly formed and can be prepared"""
@@ -1195,9 +1198,9 @@ class PreparedPlanStep(PreparedProcedureStep):
         # send each plan to correct destination
         plan_results = []
         for pplan in self.prepared_plans:
-            logger.debug(f'running plan: {pplan.name}...')
+            logger.debug('running plan: %s...', pplan.name)
             res = await pplan.run()
-            logger.debug(f'run completed: {res}')
+            logger.debug('run completed: %s', res)
             plan_results.append(res)
 
         # run the checks
@@ -1337,7 +1340,7 @@ def get_bs_state(dclass: PreparedProcedureStep) -> BlueskyState:
     return BS_STATE_MAP[top_dclass_id]
 
 
-@dataclass
+@util.slotted_dataclass
 class PreparedPlanComparison(PreparedComparison):
     """
     Unified representation for comparisons to Bluesky Plan data
@@ -1346,8 +1349,6 @@ class PreparedPlanComparison(PreparedComparison):
     plan_data: Optional[ComparisonToPlanData] = None
     #: The hierarchical parent of this comparison
     parent: Optional[PreparedPlanStep] = field(default=None, repr=None)
-    #: The value from the plan, to which the comparison will take place
-    data: Optional[Any] = None
 
     async def get_data_async(self) -> Any:
         bs_state = get_bs_state(self.parent)
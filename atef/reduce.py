@@ -53,14 +53,7 @@ class ReduceMethod(str, enum.Enum):
     @property
     def method(self) -> _ReduceMethodType:
         """Callable reduction method."""
-        return {
-            ReduceMethod.average: np.average,
-            ReduceMethod.median: np.median,
-            ReduceMethod.sum: np.sum,
-            ReduceMethod.min: np.min,
-            ReduceMethod.max: np.max,
-            ReduceMethod.std: np.std,
-        }[self]
+        return _reduce_methods[self]
 
     def reduce_values(self, values: Sequence[PrimitiveType]) -> PrimitiveType:
         """
@@ -92,6 +85,17 @@ class ReduceMethod(str, enum.Enum):
         return self.reduce_values(data)
 
 
+#: Reduce method to the function which performs it.
+_reduce_methods = {
+    ReduceMethod.average: np.average,
+    ReduceMethod.median: np.median,
+    ReduceMethod.sum: np.sum,
+    ReduceMethod.min: np.min,
+    ReduceMethod.max: np.max,
+    ReduceMethod.std: np.std,
+}
+
+
 @dataclass(frozen=True, eq=True)
 class ReductionKey:
     period: Optional[Number]
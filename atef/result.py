@@ -4,7 +4,7 @@ class, as well as accompanying helper functions
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from datetime import datetime
 from typing import List, Optional, Union
 
@@ -13,7 +13,7 @@ from atef.enums import GroupResultMode, Severity
 from atef.exceptions import PreparedComparisonException
 
 
-@dataclass(frozen=True)
+@util.slotted_dataclass(frozen=True)
 class Result:
     """
     The result of a check or step.  Contains a severity enum and reason.
@@ -47,7 +47,7 @@ class Result:
 
 
 def incomplete_result():
-    return Result(severity=Severity.warning, reason='step incomplete')
+    return Result(Severity.warning, 'step incomplete')
 
 
 def successful_result():
@@ -94,17 +94,26 @@ def _summarize_result_severity(
     Severity
         The calculated severity.
     """
-    if any(result is None or isinstance(result, Exception) for result in results):
-        return Severity.error
-
-    severities = [
-        result.severity for result in results if isinstance(result, Result)
-    ]
+    # Single pass: bail out on the first missing/failed result, otherwise
+    # track both extremes as the mode may use either
+    max_severity = Severity.success
+    min_severity = None
+    for result in results:
+        if result is None or isinstance(result, Exception):
+            return Severity.error
+        if isinstance(result, Result):
+            severity = result.severity
+            if severity > max_severity:
+                max_severity = severity
+            if min_severity is None or severity < min_severity:
+                min_severity = severity
 
     if mode == GroupResultMode.all_:
-        return util.get_maximum_severity(severities)
+        return Severity(max_severity)
 
     if mode == GroupResultMode.any_:
-        return util.get_minimum_severity(severities)
+        if min_severity is None:
+            return Severity.success
+        return Severity(min_severity)
 
     return Severity.internal_error
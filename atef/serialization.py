@@ -3,13 +3,15 @@ Serialization helpers for apischema.
 """
 # Largely based on issue discussions regarding tagged unions.
 
+import functools
 from collections import defaultdict
 from collections.abc import Callable, Iterator
 from types import new_class
 from typing import (Any, Dict, Generic, List, Tuple, TypeVar, get_origin,
                     get_type_hints)
 
-from apischema import deserializer, serializer, type_name
+from apischema import (deserialization_method, deserializer,
+                       serialization_method, serializer, type_name)
 from apischema.conversions import Conversion
 from apischema.metadata import conversion
 from apischema.objects import object_deserialization
@@ -136,3 +138,43 @@ def as_tagged_union(cls: Cls) -> Cls:
     deserializer(lazy=deserialization, target=cls)
     serializer(lazy=serialization, source=cls)
     return cls
+
+
+@functools.lru_cache(None)
+def get_deserialization_method(cls: type) -> Callable[[Any], Any]:
+    """
+    Get the apischema deserialization method for ``cls``.
+
+    The method is built once and reused, avoiding the per-call overhead of
+    ``apischema.deserialize``.
+    """
+    return deserialization_method(cls)
+
+
+@functools.lru_cache(None)
+def get_serialization_method(
+    cls: type, exclude_defaults: bool = False
+) -> Callable[[Any], Any]:
+    """
+    Get the apischema serialization method for ``cls``.
+
+    The method is built once and reused, avoiding the per-call overhead of
+    ``apischema.serialize``.
+    """
+    return serialization_method(cls, exclude_defaults=exclude_defaults)
+
+
+def prebuild_methods(*classes: type) -> None:
+    """
+    Build and cache the serialization and deserialization methods for
+    ``classes`` ahead of first use.
+
+    Building a method resolves every tagged union it contains, including the
+    subclass registry of each union, which is the bulk of the cost of the
+    first load or save.  Only call this once all subclasses are defined, as
+    the registry is fixed at that point.
+    """
+    for cls in classes:
+        get_deserialization_method(cls)
+        get_serialization_method(cls)
+        get_serialization_method(cls, exclude_defaults=True)
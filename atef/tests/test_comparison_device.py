@@ -1,6 +1,9 @@
+import asyncio
 from typing import Dict, List, Optional, Tuple
 
 import apischema
+import happi
+import numpy as np
 import ophyd
 import ophyd.sim
 import pytest
@@ -9,10 +12,12 @@ from .. import cache, check, reduce, util
 from ..check import Comparison, Severity
 from ..config import (ConfigurationFile, ConfigurationGroup,
                       DeviceConfiguration, PreparedDeviceConfiguration,
-                      PreparedFile, PreparedPVConfiguration, PVConfiguration,
-                      get_result_from_comparison)
+                      PreparedFile, PreparedGroup, PreparedPVConfiguration,
+                      PreparedSignalComparison, PVConfiguration,
+                      get_result_from_comparison, run_prepared_comparisons)
+from ..enums import GroupResultMode
 from ..exceptions import PreparedComparisonException
-from ..result import Result
+from ..result import Result, incomplete_result
 
 
 async def check_device(
@@ -196,6 +201,45 @@ async def test_result_severity(
     assert overall == severity
 
 
+def test_from_device_batch(device):
+    equals = check.Equals(value=1)
+    greater = check.Greater(value=0)
+    prepared, failures = PreparedSignalComparison.from_device_batch(
+        device,
+        by_attr={"sig1": [equals, greater], "missing": [equals, greater]},
+    )
+    assert [comp.identifier for comp in prepared] == ["dev.sig1", "dev.sig1"]
+    assert [comp.comparison for comp in prepared] == [equals, greater]
+    assert all(comp.signal is device.sig1 for comp in prepared)
+    assert len(failures) == 2
+    assert all(isinstance(ex, AttributeError) for ex in failures)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "if_disconnected", [Severity.success, Severity.warning, Severity.error]
+)
+async def test_disconnected_severity(device, if_disconnected: Severity):
+    comparison = check.Equals(value=1, if_disconnected=if_disconnected)
+    prepared = PreparedSignalComparison.from_device(
+        device, attr="sig1", comparison=comparison
+    )
+    result = await prepared._compare(None)
+    assert result.severity == if_disconnected
+    assert "dev.sig1" in result.reason
+
+
+def test_prepared_comparison_array_data():
+    data_cache = cache.DataCache()
+    comparisons = [
+        PreparedSignalComparison(cache=data_cache, data=np.arange(3))
+        for _ in range(2)
+    ]
+    # Array data is not part of equality (which would be ambiguous) or repr
+    assert comparisons[0] == comparisons[1]
+    assert "data=" not in repr(comparisons[0])
+
+
 @pytest.fixture(
     scope="function",
     params=[0, 1, 2, 3],
@@ -382,6 +426,269 @@ async def test_pv_config(
     assert overall == expected_severity
 
 
+@pytest.mark.asyncio
+async def test_fill_cache(data_cache: cache.DataCache):
+    config_file = ConfigurationFile(
+        root=ConfigurationGroup(
+            configs=[
+                PVConfiguration(
+                    by_pv={"pv1": [check.Equals(value=1)], "pv3": []},
+                    shared=[check.NotEquals(value=3)],
+                ),
+                PVConfiguration(by_pv={"pv1": [check.GreaterOrEqual(value=1)]}),
+            ]
+        )
+    )
+    prepared_file = PreparedFile.from_config(config_file, cache=data_cache)
+    assert len(list(prepared_file.walk_comparisons())) == 4
+
+    # Only one request per signal/reduction setting
+    tasks = await prepared_file.fill_cache(max_concurrency=1)
+    await asyncio.gather(*tasks)
+    assert set(data_cache.signal_data) == {
+        data_cache.signals["pv1"], data_cache.signals["pv3"]
+    }
+    assert all(
+        len(signal_data) == 1 for signal_data in data_cache.signal_data.values()
+    )
+    assert data_cache.signal_data[data_cache.signals["pv3"]] == {
+        cache.DataKey(): 2
+    }
+
+    result = await prepared_file.compare()
+    assert result.severity == Severity.success
+
+
+@pytest.mark.asyncio
+async def test_shared_comparison_prepared_once(
+    data_cache: cache.DataCache,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    shared = check.GreaterOrEqual(value=1)
+    config = PVConfiguration(
+        by_pv={"pv1": [], "pv2": [], "pv3": []},
+        shared=[shared],
+    )
+    prepared = PreparedPVConfiguration.from_config(config, cache=data_cache)
+    assert len(prepared.comparisons) == 3
+
+    calls = []
+    prepare = shared.prepare
+
+    async def counting_prepare(cache=None):
+        calls.append(cache)
+        await asyncio.sleep(0)
+        await prepare(cache)
+
+    monkeypatch.setattr(shared, "prepare", counting_prepare)
+    result = await prepared.compare(semaphore=asyncio.Semaphore(8))
+    assert result.severity == Severity.success
+    assert calls == [data_cache]
+    assert not data_cache.comparison_prepare
+
+
+@pytest.mark.asyncio
+async def test_run_prepared_comparisons():
+    in_flight = []
+    max_in_flight = 0
+
+    class FakeComparison:
+        def __init__(self, fail: bool = False):
+            self.fail = fail
+
+        async def compare(self) -> Result:
+            nonlocal max_in_flight
+            in_flight.append(self)
+            max_in_flight = max(max_in_flight, len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(self)
+            if self.fail:
+                raise RuntimeError("failed")
+            return Result()
+
+    items = [FakeComparison() for _ in range(5)] + [FakeComparison(fail=True)]
+    expected = [Severity.success] * 5 + [Severity.internal_error]
+
+    results = await run_prepared_comparisons(items)
+    assert max_in_flight == 1
+    assert [result.severity for result in results] == expected
+
+    results = await run_prepared_comparisons(
+        items, semaphore=asyncio.Semaphore(2)
+    )
+    assert max_in_flight == 2
+    assert [result.severity for result in results] == expected
+
+
+@pytest.mark.asyncio
+async def test_compare_parallel_limit(
+    data_cache: cache.DataCache, monkeypatch: pytest.MonkeyPatch
+):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def compare(self) -> Result:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return Result()
+
+    by_pv = {"pv1": [check.Equals(value=1)], "pv2": [check.Equals(value=1)]}
+    file = ConfigurationFile(
+        root=ConfigurationGroup(
+            configs=[PVConfiguration(by_pv=by_pv) for _ in range(3)],
+        )
+    )
+    prepared = PreparedFile.from_config(file, cache=data_cache)
+    monkeypatch.setattr(PreparedSignalComparison, "compare", compare)
+
+    result = await prepared.compare()
+    assert result.severity == Severity.success
+    assert max_in_flight == 1
+
+    # The limit applies across the whole file, not per configuration
+    result = await prepared.compare(parallel=True, max_concurrency=4)
+    assert result.severity == Severity.success
+    assert max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_run_prepared_comparisons_error_reason(
+    data_cache: cache.DataCache, monkeypatch
+):
+    async def compare(self) -> Result:
+        raise RuntimeError("failed")
+
+    group = ConfigurationGroup(
+        configs=[PVConfiguration(by_pv={"pv1": [check.Equals(value=1)]})],
+    )
+    prepared = PreparedGroup.from_config(group, cache=data_cache)
+    config, = prepared.configs
+    monkeypatch.setattr(PreparedSignalComparison, "compare", compare)
+    result, = await run_prepared_comparisons(config.comparisons)
+    # The reason names the comparison, rather than including its parents
+    assert result.reason == "Failed to run 'pv1': RuntimeError: failed"
+
+
+@pytest.mark.asyncio
+async def test_group_any_mode(data_cache: cache.DataCache):
+    group = ConfigurationGroup(
+        mode=GroupResultMode.any_,
+        configs=[
+            PVConfiguration(by_pv={"pv1": [check.Equals(value=2)]}),
+            PVConfiguration(by_pv={"pv2": [check.Equals(value=1)]}),
+            PVConfiguration(by_pv={"pv3": [check.Equals(value=1)]}),
+        ],
+    )
+    prepared = PreparedGroup.from_config(group, cache=data_cache)
+    result = await prepared.compare()
+    assert result.severity == Severity.success
+
+    failed, succeeded, not_run = prepared.configs
+    assert failed.combined_result.severity == Severity.error
+    assert succeeded.combined_result.severity == Severity.success
+    assert not_run.combined_result == incomplete_result()
+
+
+@pytest.mark.asyncio
+async def test_group_any_mode_cancels_pending(data_cache: cache.DataCache):
+    group = ConfigurationGroup(
+        mode=GroupResultMode.any_,
+        configs=[
+            PVConfiguration(by_pv={"pv2": [check.Equals(value=1)]}),
+            PVConfiguration(
+                by_pv={"pv3": [check.Equals(value=2, reduce_period=0.5)]}
+            ),
+        ],
+    )
+    prepared = PreparedGroup.from_config(group, cache=data_cache)
+    result = await prepared.compare(semaphore=asyncio.Semaphore(8))
+    assert result.severity == Severity.success
+
+    succeeded, not_run = prepared.configs
+    assert succeeded.combined_result.severity == Severity.success
+    assert not_run.combined_result == incomplete_result()
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+@pytest.mark.asyncio
+async def test_group_any_mode_resets_not_run(
+    data_cache: cache.DataCache,
+    monkeypatch: pytest.MonkeyPatch,
+    parallel: bool,
+):
+    first = check.Equals(value=2)
+    slow = check.Equals(value=2)
+    prepare = slow.prepare
+
+    async def slow_prepare(cache=None):
+        await asyncio.sleep(0.1)
+        await prepare(cache)
+
+    monkeypatch.setattr(slow, "prepare", slow_prepare)
+    group = ConfigurationGroup(
+        mode=GroupResultMode.any_,
+        configs=[
+            PVConfiguration(by_pv={"pv1": [first]}),
+            PVConfiguration(by_pv={"pv2": [slow]}),
+        ],
+    )
+    prepared = PreparedGroup.from_config(group, cache=data_cache)
+    _, not_run = prepared.configs
+
+    async def compare() -> Result:
+        semaphore = asyncio.Semaphore(8) if parallel else None
+        return await prepared.compare(semaphore=semaphore)
+
+    # Neither configuration succeeds, so both run to completion
+    result = await compare()
+    assert result.severity == Severity.error
+    assert not_run.combined_result.severity == Severity.error
+
+    # The second configuration is not run this time, and must not report its
+    # result from the first run
+    first.value = 1
+    result = await compare()
+    assert result.severity == Severity.success
+    assert not_run.combined_result == incomplete_result()
+    comparison, = not_run.comparisons
+    assert comparison.result == incomplete_result()
+
+
+@pytest.mark.asyncio
+async def test_group_any_mode_cancel_keeps_shared_data(
+    data_cache: cache.DataCache,
+):
+    # The cancelled pv3 comparison in the "any" group must not cancel the
+    # cached pv3 request also used by the configuration that follows it
+    group = ConfigurationGroup(
+        configs=[
+            ConfigurationGroup(
+                mode=GroupResultMode.any_,
+                configs=[
+                    PVConfiguration(by_pv={"pv2": [check.Equals(value=1)]}),
+                    PVConfiguration(
+                        by_pv={"pv3": [check.Equals(value=2, reduce_period=0.5)]}
+                    ),
+                ],
+            ),
+            PVConfiguration(
+                by_pv={"pv3": [check.Equals(value=2, reduce_period=0.5)]}
+            ),
+        ],
+    )
+    prepared = PreparedGroup.from_config(group, cache=data_cache)
+    result = await prepared.compare(semaphore=asyncio.Semaphore(8))
+    assert result.severity == Severity.success
+
+    _, shared = prepared.configs
+    assert shared.combined_result.severity == Severity.success
+    comparison, = shared.comparisons
+    assert comparison.result.severity == Severity.success
+
+
 @pytest.fixture
 def get_by_config_file() -> ConfigurationFile:
     return ConfigurationFile(
@@ -430,6 +737,23 @@ def test_get_by_pv(get_by_config_file: ConfigurationFile):
 def test_get_by_tag(get_by_config_file: ConfigurationFile):
     assert len(list(get_by_config_file.get_by_tag("a"))) == 4
     assert len(list(get_by_config_file.get_by_tag("c"))) == 1
+    assert len(list(get_by_config_file.get_by_tag("a", "c"))) == 4
+    assert not list(get_by_config_file.get_by_tag("b"))
+
+
+def test_get_by_after_modification(get_by_config_file: ConfigurationFile):
+    assert not list(get_by_config_file.get_by_device("dev_d"))
+
+    new_config = DeviceConfiguration(tags=["d"], devices=["dev_d"])
+    get_by_config_file.root.configs.append(new_config)
+    get_by_config_file.clear_indices()
+    assert list(get_by_config_file.get_by_device("dev_d")) == [new_config]
+    assert list(get_by_config_file.get_by_tag("d")) == [new_config]
+
+    # Replacing the root is picked up without clearing the indices
+    get_by_config_file.root = ConfigurationGroup()
+    assert not list(get_by_config_file.get_by_device("dev_d"))
+    assert not list(get_by_config_file.get_by_tag("a"))
 
 
 def test_bad_device_raises(monkeypatch):
@@ -481,3 +805,35 @@ def test_bad_device_in_file(monkeypatch):
     assert len(prepared.root.configs) == 1
     assert isinstance(prepared.root.configs[0], PreparedDeviceConfiguration)
     assert prepared.root.configs[0].devices == [my_device]
+
+
+def test_get_happi_devices_by_names(happi_client: happi.Client):
+    devices = util.get_happi_devices_by_names(
+        ["motor1", "enum1", "missing"], client=happi_client
+    )
+    assert set(devices) == {"motor1", "enum1"}
+    assert devices["motor1"].name == "motor1"
+    assert devices["enum1"].name == "enum1"
+
+
+def test_get_happi_devices_by_no_names(monkeypatch):
+    def no_client():
+        raise AssertionError("No client should be needed without names")
+
+    monkeypatch.setattr(util, "get_happi_client", no_client)
+    assert util.get_happi_devices_by_names([]) == {}
+
+
+def test_prepare_happi_devices(happi_client: happi.Client):
+    config = DeviceConfiguration(
+        devices=["motor2", "motor1"],
+        by_attr={"setpoint": [check.Equals(value=0)]},
+    )
+    prepared = PreparedDeviceConfiguration.from_config(config, client=happi_client)
+    assert [device.name for device in prepared.devices] == ["motor2", "motor1"]
+    assert len(prepared.comparisons) == 2
+
+    config.devices.append("missing")
+    with pytest.raises(PreparedComparisonException) as exc_info:
+        PreparedDeviceConfiguration.from_config(config, client=happi_client)
+    assert exc_info.value.identifier == "missing"
@@ -6,7 +6,7 @@ import apischema
 import pytest
 
 from .. import check, config, tools
-from ..cache import DataCache
+from ..cache import DataCache, ToolKey
 from ..config import Comparison, PreparedToolConfiguration, ToolConfiguration
 from ..enums import Severity
 from ..result import Result
@@ -142,7 +142,16 @@ class CustomTool(tools.Tool):
 
 
 @pytest.mark.asyncio
-async def test_tool_cache():
+async def test_tool_cache(monkeypatch: pytest.MonkeyPatch):
+    from_tool_calls = []
+    from_tool = ToolKey.from_tool
+
+    def counting_from_tool(tool):
+        from_tool_calls.append(tool)
+        return from_tool(tool)
+
+    monkeypatch.setattr(ToolKey, "from_tool", counting_from_tool)
+
     cache = DataCache()
     tool = CustomTool()
     first_data = await cache.get_tool_data(tool)
@@ -153,6 +162,8 @@ async def test_tool_cache():
     assert first_data is second_data
     assert isinstance(second_data, CustomToolResult)
     assert second_data.run_count == 1
+    # The key is only built once per tool instance
+    assert from_tool_calls == [tool]
 
 
 class _TestItem:
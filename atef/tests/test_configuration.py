@@ -1,7 +1,9 @@
+import json
 import pathlib
 
 import pytest
 
+from atef import util
 from atef.config import (ConfigurationFile, DeviceConfiguration, PreparedFile,
                          PreparedTemplateConfiguration, PVConfiguration,
                          TemplateConfiguration)
@@ -35,6 +37,27 @@ def test_yaml_equal_json(
     assert all_loaded_config == yaml_config
 
 
+def test_json_loader(passive_config_path: pathlib.Path):
+    """The default (possibly accelerated) loader matches the standard library"""
+    config_file = ConfigurationFile.from_json(passive_config_path)
+    std_config_file = ConfigurationFile.from_json(
+        passive_config_path, loader=json.loads
+    )
+    assert config_file == std_config_file
+
+
+def test_mapped_file(tmp_path: pathlib.Path):
+    path = tmp_path / "contents.json"
+    path.write_bytes(b"{}")
+    with util.mapped_file(path) as contents:
+        assert contents[:] == b"{}"
+
+    # Empty files cannot be memory-mapped
+    path.write_bytes(b"")
+    with util.mapped_file(path) as contents:
+        assert contents == b""
+
+
 def test_gather_pvs(
     pv_configuration: PVConfiguration,
     device_configuration: DeviceConfiguration
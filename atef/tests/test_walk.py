@@ -2,7 +2,9 @@
 
 import pytest
 
-from atef.config import ConfigurationFile, PreparedFile
+from atef.check import Equals
+from atef.config import (ConfigurationFile, ConfigurationGroup, PreparedFile,
+                         PreparedGroup, PVConfiguration)
 from atef.procedure import PreparedProcedureFile, ProcedureFile
 from atef.tests.conftest import (active_checkout_configs,
                                  passive_checkout_configs)
@@ -39,6 +41,31 @@ def test_passive_walks(filepath, num_configs, num_comps):
     assert len(list(prep_file.walk_comparisons())) == num_comps
 
 
+def test_passive_walk_cache():
+    file = ConfigurationFile(
+        root=ConfigurationGroup(
+            configs=[PVConfiguration(by_pv={"pv1": [Equals(value=1)]})]
+        )
+    )
+    prep_file = PreparedFile.from_config(file)
+    groups = list(prep_file.walk_groups())
+    comps = list(prep_file.walk_comparisons())
+    assert len(groups) == 2
+    assert len(comps) == 1
+
+    # Modifications are picked up after clearing the cache
+    pv_config = groups[1]
+    pv_config.comparisons.append(comps[0])
+    assert len(list(prep_file.walk_comparisons())) == 1
+    prep_file.clear_walk_cache()
+    assert len(list(prep_file.walk_comparisons())) == 2
+
+    # Replacing the root is detected automatically
+    prep_file.root = PreparedGroup.from_config(ConfigurationGroup())
+    assert list(prep_file.walk_groups()) == [prep_file.root]
+    assert not list(prep_file.walk_comparisons())
+
+
 def active_walk_params():
     """Zip the checkout paths with their appropriate information"""
     # name, num_items (tree), num_steps
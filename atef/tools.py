@@ -6,7 +6,8 @@ import shutil
 import sys
 import typing
 from dataclasses import dataclass, field
-from typing import Any, ClassVar, Dict, List, Mapping, Sequence, TypeVar, Union
+from typing import (Any, Callable, ClassVar, Dict, List, Mapping, Sequence,
+                    TypeVar, Union)
 
 from . import serialization
 from .check import Severity
@@ -155,40 +156,63 @@ def get_result_value_by_key(result: ToolResult, key: str) -> Any:
     Any
         The data found by the key.
     """
-    if not key:
-        raise KeyError("No key provided")
+    return get_result_value_extractor(key)(result)
 
-    item = result
-    path = []
-    key_parts = key.split(".")
 
-    while key_parts:
-        key = key_parts.pop(0)
-        path.append(key)
-        try:
-            if isinstance(item, Mapping):
-                item = item[key]
-            elif isinstance(item, Sequence):
-                item = item[int(key)]
-            else:
-                item = getattr(item, key)
-        except KeyError:
-            path_str = ".".join(path)
-            raise KeyError(
-                f"{item} does not have key {key!r} ({path_str})"
-            ) from None
-        except AttributeError:
-            path_str = ".".join(path)
-            raise KeyError(
-                f"{item} does not have attribute {key!r} ({path_str})"
-            ) from None
-        except Exception:
-            path_str = ".".join(path)
-            raise KeyError(
-                f"{item} does not have {key!r} ({path_str})"
-            )
+def get_result_value_extractor(key: str) -> Callable[[ToolResult], Any]:
+    """
+    Parse a dotted key name once, returning a function that retrieves its value.
+
+    The returned function behaves as :func:`get_result_value_by_key` with
+    ``key`` already split, so repeated lookups of the same key do not
+    re-parse it.
+
+    Parameters
+    ----------
+    key : str
+        The (optionally) dotted key name.
+
+    Returns
+    -------
+    Callable[[ToolResult], Any]
+        A function taking the result dataclass instance and returning the
+        data found by the key.  It raises ``KeyError`` if the key is blank or
+        otherwise invalid for the given result.
+    """
+    key_parts = tuple(key.split(".")) if key else ()
+
+    def extract(result: ToolResult) -> Any:
+        if not key_parts:
+            raise KeyError("No key provided")
+
+        item = result
+        for idx, key in enumerate(key_parts):
+            try:
+                if isinstance(item, Mapping):
+                    item = item[key]
+                elif isinstance(item, Sequence):
+                    item = item[int(key)]
+                else:
+                    item = getattr(item, key)
+            except KeyError:
+                path_str = ".".join(key_parts[:idx + 1])
+                raise KeyError(
+                    f"{item} does not have key {key!r} ({path_str})"
+                ) from None
+            except AttributeError:
+                path_str = ".".join(key_parts[:idx + 1])
+                raise KeyError(
+                    f"{item} does not have attribute {key!r} ({path_str})"
+                ) from None
+            except Exception:
+                path_str = ".".join(key_parts[:idx + 1])
+                raise KeyError(
+                    f"{item} does not have {key!r} ({path_str})"
+                )
+
+        return item
 
-    return item
+    return extract
 
 
 @dataclass
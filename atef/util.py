@@ -1,9 +1,15 @@
 import asyncio
 import concurrent.futures
+import contextlib
+import dataclasses
 import functools
 import logging
+import mmap
 import pathlib
-from typing import Callable, List, Optional, Sequence, TypeVar
+import re
+import sys
+from typing import (Callable, Dict, Iterator, List, Optional, Sequence,
+                    TypeVar, Union)
 
 import happi
 import ophyd
@@ -11,6 +17,7 @@ import ophyd
 from .enums import Severity
 from .exceptions import (HappiLoadError, HappiUnavailableError,
                          MissingHappiDeviceError)
+from .type_hints import AnyPath
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +90,73 @@ def get_happi_device_by_name(
         ex.dev_config = None
         raise ex
 
+    return _instantiate_happi_search_result(name, search_result)
+
+
+def get_happi_devices_by_names(
+    names: Sequence[str],
+    *,
+    client: Optional[happi.Client] = None,
+) -> Dict[str, Union[ophyd.Device, Exception]]:
+    """
+    Get instantiated devices from the happi database by name, using a single
+    database search.
+
+    Names that the search does not resolve are omitted from the result; use
+    `get_happi_device_by_name` to load (or report errors for) those
+    individually.
+
+    Parameters
+    ----------
+    names : Sequence[str]
+        The device names.
+
+    client : happi.Client, optional
+        The happi Client instance, if available.  Defaults to instantiating
+        a temporary client with the environment configuration.
+
+    Returns
+    -------
+    Dict[str, Union[ophyd.Device, Exception]]
+        Device name to the instantiated device or, if instantiation failed,
+        the exception that was raised.
+    """
+    names = list(dict.fromkeys(names))
+    if not names:
+        return {}
+
+    if client is None:
+        client = get_happi_client()
+
+    if client is None:
+        return {}
+
+    pattern = "|".join(f"^{re.escape(name)}$" for name in names)
+    try:
+        search_results = client.search_regex(flags=0, name=pattern)
+    except Exception:
+        logger.debug("Failed to search happi for devices %s", names, exc_info=True)
+        return {}
+
+    devices = {}
+    for search_result in search_results:
+        if isinstance(search_result, happi.client.InvalidResult):
+            continue
+
+        name = search_result.item.name
+        try:
+            devices[name] = _instantiate_happi_search_result(name, search_result)
+        except HappiLoadError as ex:
+            devices[name] = ex
+
+    return devices
+
+
+def _instantiate_happi_search_result(
+    name: str,
+    search_result: happi.client.SearchResult,
+) -> ophyd.Device:
+    """Instantiate the device from a happi search result."""
     try:
         return search_result.get()
     except Exception as ex:
@@ -102,17 +176,64 @@ def get_happi_device_by_name(
 
 def get_maximum_severity(severities: Sequence[Severity]) -> Severity:
     """Get the maximum severity defined from the sequence of severities."""
-    return Severity(
-        max(severity.value for severity in tuple(severities) + (Severity.success, ))
-    )
+    # Severity is an IntEnum, so members compare directly as integers
+    return Severity(max(severities, default=Severity.success))
 
 
 def get_minimum_severity(severities: Sequence[Severity]) -> Severity:
     """Get the minimum severity defined from the sequence of severities."""
-    severities = tuple(severities)
-    if not severities:
-        return Severity.success
-    return Severity(min(severity.value for severity in severities))
+    return Severity(min(severities, default=Severity.success))
+
+
+def slotted_dataclass(cls: Optional[type] = None, /, **kwargs):
+    """
+    Equivalent to ``dataclasses.dataclass``, but generates ``__slots__`` where
+    supported (Python 3.10+).
+
+    Slotted instances have no ``__dict__``, so only declared fields may be set.
+
+    Parameters
+    ----------
+    cls : type, optional
+        The class to wrap.  Omit when passing keyword arguments.
+    **kwargs :
+        Keyword arguments to pass to ``dataclasses.dataclass``.
+    """
+    if sys.version_info >= (3, 10):
+        kwargs.setdefault("slots", True)
+    if cls is None:
+        return functools.partial(dataclasses.dataclass, **kwargs)
+    return dataclasses.dataclass(cls, **kwargs)
+
+
+@contextlib.contextmanager
+def mapped_file(filename: AnyPath) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Map a file into memory, read-only, for the duration of the context.
+
+    Parsers can then work from the page cache directly instead of from a
+    copy of the file contents.  Files that cannot be mapped (such as empty
+    files) are read into ``bytes`` instead.
+
+    Parameters
+    ----------
+    filename : AnyPath
+        The file to map.
+
+    Yields
+    ------
+    mmap.mmap or bytes
+        The file contents.
+    """
+    with open(filename, "rb") as fp:
+        try:
+            mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            yield fp.read()
+            return
+
+        with mapped:
+            yield mapped
 
 
 def regex_for_devices(names: Optional[Sequence[str]]) -> str:
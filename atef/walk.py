@@ -6,45 +6,80 @@ note that if a configuration fails to prepare, they will be skipped
 """
 from __future__ import annotations
 
-from typing import Generator, List, Tuple, Union
+from typing import Any, Callable, Dict, Generator, List, Tuple, Union
 
 from atef.check import Comparison
 from atef.config import (AnyPreparedConfiguration, Configuration,
                          PreparedComparison, PreparedConfiguration,
-                         PreparedFile)
+                         PreparedFile, PreparedGroup)
 from atef.procedure import (AnyPreparedProcedure, PreparedProcedureFile,
                             PreparedProcedureStep, ProcedureStep)
 
 
+def _get_file_children(file: PreparedFile) -> List[PreparedGroup]:
+    return [file.root]
+
+
+def _get_config_children(
+    config: PreparedConfiguration,
+) -> List[Union[AnyPreparedConfiguration, PreparedComparison]]:
+    return [*getattr(config, 'configs', ()), *getattr(config, 'comparisons', ())]
+
+
+def _get_no_children(item: Any) -> List[Any]:
+    return []
+
+
+#: Prepared class to the function which gets its children, by exact type.
+#: Subclasses are added on first use, based on their closest listed base.
+_config_children_getters: Dict[type, Callable[[Any], List[Any]]] = {
+    PreparedFile: _get_file_children,
+    PreparedConfiguration: _get_config_children,
+}
+
+
+def _get_children_getter(cls: type) -> Callable[[Any], List[Any]]:
+    """Get the function which gets the children of a ``cls`` instance."""
+    try:
+        return _config_children_getters[cls]
+    except KeyError:
+        pass
+
+    getter = _get_no_children
+    for base in cls.__mro__[1:]:
+        if base in _config_children_getters:
+            getter = _config_children_getters[base]
+            break
+
+    _config_children_getters[cls] = getter
+    return getter
+
+
 def walk_config_file(
     config: Union[PreparedFile, PreparedConfiguration, PreparedComparison],
     level: int = 0
 ) -> Generator[Tuple[Union[AnyPreparedConfiguration, PreparedComparison], int], None, None]:
     """
     Yields each config and comparison and its depth
-    Performs a recursive depth-first search
+    Performs a depth-first search
 
     Parameters
     ----------
     config : Union[PreparedFile, PreparedConfiguration, PreparedComparison]
         the configuration or comparison to walk
     level : int, optional
-        the current recursion depth, by default 0
+        the starting depth, by default 0
 
     Yields
     ------
     Generator[Tuple[Any, int], None, None]
     """
-    yield config, level
-    if isinstance(config, PreparedFile):
-        yield from walk_config_file(config.root, level=level+1)
-    elif isinstance(config, PreparedConfiguration):
-        if hasattr(config, 'configs'):
-            for conf in config.configs:
-                yield from walk_config_file(conf, level=level+1)
-        if hasattr(config, 'comparisons'):
-            for comp in config.comparisons:
-                yield from walk_config_file(comp, level=level+1)
+    stack = [(config, level)]
+    while stack:
+        item, depth = stack.pop()
+        yield item, depth
+        children = _get_children_getter(type(item))(item)
+        stack.extend((child, depth + 1) for child in reversed(children))
 
 
 def walk_procedure_file(
@@ -25,6 +25,7 @@ from qtpy.QtCore import Signal as QSignal
 from qtpy.QtWidgets import (QAction, QFileDialog, QMainWindow, QMessageBox,
                             QTabWidget, QWidget)
 
+from atef import serialization
 from atef.cache import DataCache
 from atef.config import ConfigurationFile, PreparedFile, TemplateConfiguration
 from atef.exceptions import PreparationError
@@ -116,6 +117,14 @@ class Window(DesignerDisplay, QMainWindow):
         if show_welcome:
             QTimer.singleShot(0, self.welcome_user)
 
+        # Resolve the file (de)serializers while the user picks a file
+        QTimer.singleShot(
+            0,
+            lambda: serialization.prebuild_methods(
+                ConfigurationFile, ProcedureFile
+            ),
+        )
+
     def welcome_user(self):
         """
         On open, ask the user what they'd like to do (new config? load?)
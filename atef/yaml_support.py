@@ -1,5 +1,23 @@
 import yaml
 
+#: The fastest available safe loader (libyaml-backed, if available).
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _YamlDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+    """
+    The fastest available safe dumper (libyaml-backed, if available).
+
+    Serialized dataclasses are plain trees with no shared containers, so
+    tracking object identity for anchors and aliases is skipped.
+    """
+
+    def ignore_aliases(self, data) -> bool:
+        return True
+
+
+_YAML_DUMPER = _YamlDumper
+
 _yaml_initialized = False
 
 
@@ -23,6 +41,13 @@ def init_yaml_support():
     # The ugliness of this makes me think we should use a different library
     from . import enums, reduce
 
-    yaml.add_representer(enums.Severity, int_enum_representer)
-    yaml.add_representer(enums.GroupResultMode, str_enum_representer)
-    yaml.add_representer(reduce.ReduceMethod, str_enum_representer)
+    # Representers are stored per-dumper class; register with the default
+    # dumper as well as the (possibly C-accelerated) safe dumper we use
+    for dumper in {yaml.Dumper, yaml.SafeDumper, _YAML_DUMPER}:
+        yaml.add_representer(enums.Severity, int_enum_representer, Dumper=dumper)
+        yaml.add_representer(
+            enums.GroupResultMode, str_enum_representer, Dumper=dumper
+        )
+        yaml.add_representer(
+            reduce.ReduceMethod, str_enum_representer, Dumper=dumper
+        )